@@ -1,21 +1,41 @@
 import re
 import json
+import atexit
 from datetime import datetime
 
+#use orjson when it's installed (much faster), otherwise fall back to the stdlib
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+#every playthrough is appended as one line to this file
+LOG_FILE = "alien_invasion_runs.jsonl"
+_LOG_FH = open(LOG_FILE, "ab", buffering=64 * 1024)
+atexit.register(_LOG_FH.close) # flush and close the log when the program exits
+
+#regex for input validation(starts with a letter, between 3 and 16 total chars)
+_NAME_RE = re.compile(r"^[A-Za-z][A-Za-z0-9_]{2,15}$")
+
+#valid answers for the two-option scene prompts
+_BIN_CHOICES = frozenset({"1", "2"})
+
 #json save function
-def save_run(name, decisions, final_state):
+def save_run(name, decisions, final_state, ending_text):
     data = {
         "name": name,
         "timestamp": datetime.now().isoformat(timespec="seconds"),
         "decisions": decisions,
         "outcome": final_state,
-        "ending_text": OUTCOMES[final_state]
+        "ending_text": ending_text
     }
-    filename = f"alien_invasion_{name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-    with open(filename, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
+    if orjson is not None:
+        payload = orjson.dumps(data)
+    else:
+        payload = json.dumps(data).encode("utf-8")
+    _LOG_FH.write(payload + b"\n")
 
-    print(f"\nGame saved to file: {filename}")
+    print(f"\nGame saved to file: {LOG_FILE}")
 
 #game segments
 def display_title():
@@ -26,16 +46,12 @@ def display_title():
     print("Instructions:")
     print("- Type the number of your choice and press Enter.")
     print("- Your decisions affect the ending.")
-    print("- Your run will be saved to a JSON file at the end.")
+    print("- Your run will be added to a JSON log file at the end.")
     print("=" * 60)
 def game_start():
-
-    #regex for input validation(starts with a letter, between 3 and 16 total chars)
-    pattern = r"^[A-Za-z][A-Za-z0-9_]{2,15}$"
-
     while True:
         name = input("\nEnter your name/codename (3-16 chars, start with a letter): ").strip()
-        if re.match(pattern, name):
+        if _NAME_RE.match(name):
             return name
         print("Invalid. Example valid names: Ghost, Neo_7, Raven99")
 def scene_bedroom():
@@ -46,7 +62,7 @@ def scene_bedroom():
     while True:
         choice = input("Choose 1 or 2: ").strip()
      
-        if choice == "1" or choice == "2":
+        if choice in _BIN_CHOICES:
             return choice
         else:
             print("Invalid input. Please try again.")
@@ -66,7 +82,7 @@ def scene_under_bed():
 
     while True:
         choice = input("Choose 1 or 2: ").strip()
-        if choice == "1" or choice == "2":
+        if choice in _BIN_CHOICES:
             return choice
         print("Invalid input. Please enter 1 or 2.")
 
@@ -112,7 +128,7 @@ def main():
         print(decisions)
 
         #save to json file
-        save_run(name, decisions, final_state)
+        save_run(name, decisions, final_state, ending_text)
 
         print("\n\nWould you like to play again?")
         print("1) Keep playing")
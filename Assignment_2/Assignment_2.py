@@ -1,63 +1,86 @@
+import atexit
 import sqlite3
+import sys
 
 #reusable variables
 DB_FILE = "students.db"
+ANALYZE_MIN_ROWS = 100 # bulk inserts at least this big run ANALYZE afterwards
 
-def connect_db():
-    return sqlite3.connect(DB_FILE)
+_conn = None # shared connection, opened once by get_conn()
 
-def setup_table():
-    database = connect_db() # open database file
+def get_conn():
+    global _conn
+    if _conn is None:
+        #autocommit mode, so each statement is saved without an explicit commit()
+        _conn = sqlite3.connect(DB_FILE, isolation_level=None, check_same_thread=False)
+
+        #WAL + NORMAL sync avoids a full fsync on every write
+        _conn.executescript("""
+            PRAGMA journal_mode=WAL;
+            PRAGMA synchronous=NORMAL;
+            PRAGMA busy_timeout=5000;
+            PRAGMA temp_store=MEMORY;
+            PRAGMA cache_size=-16000;
+        """)
+
+        atexit.register(_conn.close) # close database when the program exits
+    return _conn
 
+def setup_table():
     #make sure students table exists in db
-    database.execute("""CREATE TABLE IF NOT EXISTS students (id INTEGER PRIMARY KEY, name TEXT NOT NULL, grade TEXT NOT NULL, email TEXT NOT NULL);""")
+    get_conn().execute("""CREATE TABLE IF NOT EXISTS students (id INTEGER PRIMARY KEY, name TEXT NOT NULL, grade TEXT NOT NULL, email TEXT NOT NULL);""")
+
+    #index for looking students up by name
+    get_conn().execute("CREATE INDEX IF NOT EXISTS idx_students_name ON students(name);")
 
-    database.commit() # save changes to db
-    database.close() # close database
+def optimize():
+    #refresh table stats so the query planner can pick the index
+    get_conn().execute("ANALYZE")
 
 #back end functions
 def add_student(name, grade, email): # function for adding students to the database
-    database = connect_db()
-
     #inserts data into the db
-    database.execute("INSERT INTO students (name, grade, email) VALUES (?, ?, ?)", (name, grade, email))
+    get_conn().execute("INSERT INTO students (name, grade, email) VALUES (?, ?, ?)", (name, grade, email))
 
-    #save and exits updated db
-    database.commit() 
-    database.close() 
+def add_students_bulk(rows): # function for adding many (name, grade, email) rows at once
+    if not rows: #nothing to insert
+        return
 
-def view_students_db(): #function for viewing students within the databse
-    database = connect_db()
+    database = get_conn()
 
-    #create a cursor to grab students records in the db
-    cursor = database.execute("SELECT id, name, grade, email FROM students")
+    #one transaction for the whole batch instead of one per row
+    database.execute("BEGIN")
+    try:
+        database.executemany("INSERT INTO students (name, grade, email) VALUES (?, ?, ?)", rows)
+    except Exception:
+        database.execute("ROLLBACK")
+        raise
+    database.execute("COMMIT")
 
-    #saves the database object as rows
-    rows = cursor.fetchall()
+    #only refresh stats after a real bulk load; small menu adds don't need a full ANALYZE
+    if len(rows) >= ANALYZE_MIN_ROWS:
+        optimize()
 
-    #print the database one row at a time
-    for row in rows: 
-        print(row)
+def view_students_db(): #function for viewing students within the databse
+    #create a cursor to grab students records in the db
+    cursor = get_conn().execute("SELECT id, name, grade, email FROM students")
 
-    database.close()
+    #print the database one row at a time straight from the cursor (no full list in memory)
+    write = sys.stdout.write
+    for row in cursor:
+        write("%d\t%s\t%s\t%s\n" % row)
 
 def update_student(student_id, name, grade, email):
-    database = connect_db()
-    database.execute(
+    get_conn().execute(
         "UPDATE students SET name = ?, grade = ?, email = ? WHERE id = ?",
         (name, grade, email, student_id)
     )
-    database.commit()
-    database.close()
 
 def delete_student(student_id):
-    database = connect_db()
-    database.execute(
+    get_conn().execute(
         "DELETE FROM students WHERE id = ?",
         (student_id,)
     )
-    database.commit()
-    database.close()
 
 
 #user interface functions
@@ -73,6 +96,61 @@ def user_choice():
     choice = input("Choose an option (1-5): ").strip()
     return choice
 
+def handle_add():
+    #collect students until a blank name is entered, then save them together
+    rows = []
+    while True:
+        name = input("Name (blank to finish): ").strip()
+        if not name:
+            break
+        grade = input("Grade: ").strip()
+        email = input("Email: ").strip()
+        rows.append((name, grade, email))
+
+    if not rows: #blank name right away, nothing to save
+        return
+
+    if len(rows) == 1:
+        add_student(*rows[0])
+    else:
+        add_students_bulk(rows)
+    print(f"{len(rows)} Student(s) Added")
+
+def handle_update():
+    try: 
+        student_id = int(input("Student ID to update: ").strip())
+        name = input("New name: ").strip()
+        grade = input("New grade: ").strip()
+        email = input("New email: ").strip()
+
+        update_student(student_id, name, grade, email)
+        print("Student updated.")
+
+    except ValueError: 
+        print("Invalid ID. Must be a number.")
+
+def handle_delete():
+    try:
+        student_id = int(input("Student ID to delete: ").strip())
+        confirm = input(f"Delete student {student_id}? (y/n): ").strip().lower()
+
+        if confirm == "y":
+            delete_student(student_id)
+            print("Student deleted.")
+        else:
+            print("Delete canceled.")
+
+    except ValueError:
+        print("Invalid ID. Must be a number.")
+
+#menu option -> handler function
+HANDLERS = {
+    "1": handle_add,
+    "2": view_students_db,
+    "3": handle_update,
+    "4": handle_delete,
+}
+
 def main():
     setup_table()
 
@@ -81,42 +159,9 @@ def main():
         print_menu()
         choice = user_choice()
 
-        if choice == "1":
-            name = input("Name: ").strip()
-            grade = input("Grade: ").strip()
-            email = input("Email: ").strip()
-            add_student(name, grade, email)
-            print("Student Added")
-        
-        elif choice == "2":
-            view_students_db()
-        
-        elif choice == "3": 
-            try: 
-                student_id = int(input("Student ID to update: ").strip())
-                name = input("New name: ").strip()
-                grade = input("New grade: ").strip()
-                email = input("New email: ").strip()
-
-                update_student(student_id, name, grade, email)
-                print("Student updated.")
-
-            except ValueError: 
-                print("Invalid ID. Must be a number.")
-
-        elif choice == "4": 
-            try:
-                student_id = int(input("Student ID to delete: ").strip())
-                confirm = input(f"Delete student {student_id}? (y/n): ").strip().lower()
-
-                if confirm == "y":
-                    delete_student(student_id)
-                    print("Student deleted.")
-                else:
-                    print("Delete canceled.")
-
-            except ValueError:
-                print("Invalid ID. Must be a number.")
+        handler = HANDLERS.get(choice)
+        if handler:
+            handler()
 
         elif choice == "5": 
             done = True
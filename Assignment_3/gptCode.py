@@ -8,7 +8,7 @@ This program:
 4) Trains a Linear Regression model (scikit-learn)
 5) Prints coefficient, intercept, and R^2 score
 6) Visualizes model fit (scatter + regression line)
-7) Prompts the user for a house size and predicts price
+7) Prompts the user for house size(s) and predicts prices
 8) Handles errors (file missing, empty file, bad input, etc.)
 
 Run:
@@ -16,10 +16,12 @@ Run:
 
 Files:
     housing_data.csv (auto-created if missing/empty)
+    housing_data.feather (parsed cache, rebuilt whenever the CSV is newer)
 """
 
 from __future__ import annotations
 
+import os
 import sys
 from pathlib import Path
 
@@ -29,7 +31,15 @@ import matplotlib.pyplot as plt
 
 from sklearn.linear_model import LinearRegression
 from sklearn.metrics import r2_score
-from sklearn.model_selection import train_test_split
+
+# Numba is optional: without it, _predict simply runs as plain Python/NumPy.
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
 
 
 CSV_PATH = Path(__file__).with_name("housing_data.csv")
@@ -75,42 +85,77 @@ def ensure_csv_exists(csv_path: Path) -> None:
         csv_path.write_text(SAMPLE_CSV_TEXT, encoding="utf-8")
 
 
-def load_data(csv_path: Path) -> pd.DataFrame:
-    """Load housing dataset and validate required columns."""
-    ensure_csv_exists(csv_path)
+def read_cached(csv_path: Path, cache_path: Path) -> pd.DataFrame | None:
+    """Return the parsed dataset from the feather cache if it is newer than the CSV."""
+    try:
+        if cache_path.stat().st_mtime_ns > csv_path.stat().st_mtime_ns:
+            return pd.read_feather(cache_path)
+    except Exception:
+        # Missing/unreadable cache or no pyarrow: fall back to parsing the CSV
+        pass
+    return None
 
-    # Debug print so you know EXACTLY what file is being read
-    print("\n=== CSV DEBUG ===")
-    print("Reading CSV from:", csv_path.resolve())
-    print("File exists?:", csv_path.exists())
-    print("File size (bytes):", csv_path.stat().st_size)
+
+def write_cache(df: pd.DataFrame, cache_path: Path) -> None:
+    """Save the parsed dataset as feather so the next run can skip CSV parsing."""
     try:
-        preview = csv_path.read_text(encoding="utf-8", errors="replace").splitlines()[:3]
-        print("First lines:", preview)
-    except Exception as e:
-        print("Could not preview file text:", e)
-    print("=================\n")
+        df.reset_index(drop=True).to_feather(cache_path)
+    except Exception:
+        # Caching is best-effort (e.g. pyarrow not installed, read-only folder)
+        pass
+
 
+def read_csv_data(csv_path: Path) -> pd.DataFrame:
+    """Parse the Size/Price columns from the CSV and drop incomplete rows."""
     try:
-        # utf-8-sig handles BOM weirdness
-        df = pd.read_csv(csv_path, encoding="utf-8-sig")
+        # utf-8-sig handles BOM weirdness; only the two numeric columns are parsed, straight to float32
+        df = pd.read_csv(
+            csv_path,
+            encoding="utf-8-sig",
+            usecols=["Size", "Price"],
+            dtype={"Size": np.float32, "Price": np.float32},
+            engine="c",
+        )
+    except ValueError as e:
+        raise ValueError(f"ERROR: CSV must contain numeric columns ['Price', 'Size']. Details: {e}")
     except Exception as e:
         raise RuntimeError(f"ERROR: Failed to read CSV. Details: {e}")
 
-    required = {"Size", "Price"}
-    if not required.issubset(df.columns):
-        raise ValueError(f"ERROR: CSV must contain columns {sorted(required)}. Found: {list(df.columns)}")
+    # Drop rows with missing values (dtypes are already numeric, so no coercion pass)
+    df.dropna(subset=["Size", "Price"], inplace=True)
+    return df
+
 
-    # Convert to numeric, drop bad rows
-    df = df.copy()
-    df["Size"] = pd.to_numeric(df["Size"], errors="coerce")
-    df["Price"] = pd.to_numeric(df["Price"], errors="coerce")
-    df = df.dropna(subset=["Size", "Price"])
+def load_data(csv_path: Path) -> pd.DataFrame:
+    """Load housing dataset and validate required columns."""
+    ensure_csv_exists(csv_path)
+
+    cache_path = csv_path.with_suffix(".feather")
+    df = read_cached(csv_path, cache_path)
+
+    # Debug print so you know EXACTLY what file is being read (set HOUSING_DEBUG=1 to enable)
+    if os.environ.get("HOUSING_DEBUG"):
+        print("\n=== CSV DEBUG ===")
+        if df is not None:
+            print("Reading feather cache from:", cache_path.resolve())
+        else:
+            print("Reading CSV from:", csv_path.resolve())
+            try:
+                preview = csv_path.read_text(encoding="utf-8", errors="replace").splitlines()[:3]
+                print("First lines:", preview)
+            except Exception as e:
+                print("Could not preview file text:", e)
+        print("=================\n")
+
+    if df is None:
+        df = read_csv_data(csv_path)
+        write_cache(df, cache_path)
 
     if len(df) < 20:
         raise ValueError(f"ERROR: Dataset must have at least 20 valid rows. Found {len(df)}")
 
-    if (df["Size"] <= 0).any() or (df["Price"] <= 0).any():
+    # One pass over both columns at once
+    if (df[["Size", "Price"]].to_numpy() <= 0).any():
         raise ValueError("ERROR: Size and Price must be positive.")
 
     return df
@@ -132,26 +177,32 @@ def plot_scatter(df: pd.DataFrame) -> None:
     plt.show()
 
 
-def train_model(df: pd.DataFrame) -> tuple[LinearRegression, float]:
-    X = df[["Size"]].values
-    y = df["Price"].values
+def _split(X: np.ndarray, y: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """80/20 train/test split from a fixed-seed permutation (cheap for small datasets)."""
+    idx = np.arange(len(X))
+    np.random.default_rng(42).shuffle(idx)
+    k = int(0.8 * len(idx))
+    tr, te = idx[:k], idx[k:]
+    return X[tr], X[te], y[tr], y[te]
 
-    X_train, X_test, y_train, y_test = train_test_split(
-        X, y, test_size=0.2, random_state=42
-    )
+
+def train_model(df: pd.DataFrame) -> tuple[float, float, float]:
+    """Fit the model and return (slope, intercept, test-set R^2)."""
+    # float32 is only for storage; fit in float64 so the intercept stays precise
+    X = df[["Size"]].to_numpy(dtype=np.float64)
+    y = df["Price"].to_numpy(dtype=np.float64)
+
+    X_train, X_test, y_train, y_test = _split(X, y)
 
     model = LinearRegression()
     model.fit(X_train, y_train)
 
     y_pred = model.predict(X_test)
     r2 = r2_score(y_test, y_pred)
-    return model, r2
-
+    return float(model.coef_[0]), float(model.intercept_), r2
 
-def print_model_info(model: LinearRegression, r2: float) -> None:
-    slope = float(model.coef_[0])
-    intercept = float(model.intercept_)
 
+def print_model_info(slope: float, intercept: float, r2: float) -> None:
     print("=== MODEL RESULTS ===")
     print(f"Coefficient (slope):  {slope:,.4f} $ per sqft")
     print(f"Intercept:            {intercept:,.2f} $")
@@ -159,12 +210,12 @@ def print_model_info(model: LinearRegression, r2: float) -> None:
     print()
 
 
-def plot_model_fit(df: pd.DataFrame, model: LinearRegression) -> None:
-    X = df[["Size"]].values
+def plot_model_fit(df: pd.DataFrame, slope: float, intercept: float) -> None:
+    X = df["Size"].values
     y = df["Price"].values
 
-    x_line = np.linspace(X.min(), X.max(), 200).reshape(-1, 1)
-    y_line = model.predict(x_line)
+    x_line = np.linspace(X.min(), X.max(), 200)
+    y_line = slope * x_line + intercept
 
     plt.figure()
     plt.scatter(X, y)
@@ -176,23 +227,30 @@ def plot_model_fit(df: pd.DataFrame, model: LinearRegression) -> None:
     plt.show()
 
 
-def get_user_size() -> float | None:
+def get_user_size() -> np.ndarray | None:
+    """Read one or more comma-separated sizes, e.g. "1500, 1800, 2100"."""
     while True:
-        raw = input("Enter a house size in sqft (or 'q' to quit): ").strip().lower()
+        raw = input("Enter house size(s) in sqft, comma-separated (or 'q' to quit): ").strip().lower()
         if raw in {"q", "quit", "exit"}:
             return None
         try:
-            size = float(raw)
-            if size <= 0:
-                print("Size must be positive. Try again.")
+            sizes = np.array([float(part) for part in raw.split(",")], dtype=np.float64)
+            if (sizes <= 0).any():
+                print("Sizes must be positive. Try again.")
                 continue
-            return size
+            return sizes
         except ValueError:
-            print("Invalid input. Enter a number like 1500 or type 'q'.")
+            print("Invalid input. Enter numbers like 1500 or 1500, 1800 or type 'q'.")
+
+
+@njit(cache=True)
+def _predict(slope, intercept, x):
+    return slope * x + intercept
 
 
-def predict_price(model: LinearRegression, size_sqft: float) -> float:
-    return float(model.predict(np.array([[size_sqft]], dtype=float))[0])
+def predict_prices(slope: float, intercept: float, sizes: np.ndarray) -> np.ndarray:
+    """Predict prices for a whole array of sizes in one vectorized call."""
+    return _predict(slope, intercept, np.asarray(sizes, dtype=np.float64))
 
 
 def main() -> None:
@@ -206,21 +264,23 @@ def main() -> None:
     plot_scatter(df)
 
     try:
-        model, r2 = train_model(df)
+        slope, intercept, r2 = train_model(df)
     except Exception as e:
         print(f"ERROR: Model training failed. Details: {e}")
         sys.exit(1)
 
-    print_model_info(model, r2)
-    plot_model_fit(df, model)
+    print_model_info(slope, intercept, r2)
+    plot_model_fit(df, slope, intercept)
 
     while True:
-        size = get_user_size()
-        if size is None:
+        sizes = get_user_size()
+        if sizes is None:
             print("Goodbye.")
             break
-        est_price = predict_price(model, size)
-        print(f"Estimated price for {size:,.0f} sqft: ${est_price:,.2f}\n")
+        est_prices = predict_prices(slope, intercept, sizes)
+        for size, price in zip(sizes, est_prices):
+            print(f"Estimated price for {size:,.0f} sqft: ${price:,.2f}")
+        print()
 
 
 if __name__ == "__main__":
@@ -1,22 +1,20 @@
+from collections import namedtuple
 from pathlib import Path
 import matplotlib.pyplot as plot
+import numpy
 import pandas
 
-from sklearn.linear_model import LinearRegression
-from sklearn.model_selection import train_test_split
-from sklearn.metrics import r2_score
-
 DATA_FILE = "housing_data.csv"
 
 #Load housing data from CSV file
 def load_data(filename):
     try: 
-        df = pandas.read_csv(filename)
+        #only read the two numeric columns, parsed straight to float32
+        df = pandas.read_csv(filename, usecols=["Size", "Price"], dtype={"Size": "float32", "Price": "float32"}, engine="c")
     except FileNotFoundError:
         print("Error: CSV file not found.")
         return None
-    
-    if "Size" not in df.columns or "Price" not in df.columns:
+    except ValueError: #missing columns or non-numeric values
         print("Error: CSV is in the wrong format.")
         return
     
@@ -36,24 +34,41 @@ def plot_data(df):
     plot.grid(True)
     plot.show()
 
+#Fitted line (slope + intercept) with a sklearn-style predict
+class LinearFit(namedtuple("LinearFit", ["slope", "intercept"])):
+    def predict(self, x):
+        return self.slope * numpy.asarray(x, dtype=float).ravel() + self.intercept
+
+#80/20 train/test split from a fixed-seed permutation
+def split_data(x, y):
+    idx = numpy.arange(len(x))
+    numpy.random.default_rng(42).shuffle(idx)
+    k = int(0.8 * len(idx))
+    train, test = idx[:k], idx[k:]
+    return x[train], x[test], y[train], y[test]
+
 def ml_training(df):
-    x = df[["Size"]]
-    y = df["Price"]
+    x = df["Size"].to_numpy(dtype=float)
+    y = df["Price"].to_numpy(dtype=float)
 
-    x_train, x_test, y_train, y_test = train_test_split(x, y, test_size=0.2, random_state=42)
+    x_train, x_test, y_train, y_test = split_data(x, y)
 
-    model = LinearRegression()
-    model.fit(x_train, y_train)
+    #closed-form least squares for a single feature
+    xm, ym = x_train.mean(), y_train.mean()
+    slope = ((x_train - xm) * (y_train - ym)).sum() / ((x_train - xm) ** 2).sum()
+    intercept = ym - slope * xm
+    model = LinearFit(float(slope), float(intercept))
 
+    #R^2 on the test set
     predictions = model.predict(x_test)
-    r2 = r2_score(y_test, predictions)
+    r2 = 1 - ((y_test - predictions) ** 2).sum() / ((y_test - y_test.mean()) ** 2).sum()
 
-    return model, r2
+    return model, float(r2)
 
 def show_model_results(model, r2):
     print("\nModel results:")
-    print(f"Slope (price per sqft): {model.coef_[0]:.2f}")
-    print(f"Intercept: {model.intercept_:.2f}")
+    print(f"Slope (price per sqft): {model.slope:.2f}")
+    print(f"Intercept: {model.intercept:.2f}")
     print(f"R^2 score: {r2:.4f}")
 
 def main():